@@ -424,11 +424,20 @@ class PInvocation(tuple):
 		# as the first item, the second item is the program's runtime name
 		# that is accessible as the first argument. Often, the basename of the
 		# command if it were invoked using (system:environment)`PATH` resolution.
+
+		# Identical commands share a single &Invocation as the argument and
+		# environment vectors are prepared once by its construction.
 		"""
-		return Class([
-			Class.Invocation(path, args)
-			for path, *args in commands
-		])
+		prepared = {}
+		invs = []
+		for path, *args in commands:
+			key = (path, tuple(args))
+			inv = prepared.get(key)
+			if inv is None:
+				inv = prepared[key] = Class.Invocation(path, args)
+			invs.append(inv)
+
+		return Class(invs)
 
 	@classmethod
 	def from_pairs(Class, commands):
@@ -513,7 +522,30 @@ class PInvocation(tuple):
 				close(pipes[-1][1])
 	__call__ = spawn
 
-def parse_sx_plan(text) -> typing.Tuple[
+def _sx_inline(parameters, exe, field):
+	parameters.extend(field[1:].strip().split(' '))
+
+def _sx_literal(parameters, exe, field):
+	parameters.append(field[1:])
+
+def _sx_executable(parameters, exe, field):
+	parameters.append(exe)
+
+def _sx_newlines(parameters, exe, field):
+	# Newline count and optional suffix separated by the first space.
+	nlines, _, suffix = field[1:].partition(' ')
+	parameters[-1] += (nlines.count('n') * '\n')
+	parameters[-1] += suffix
+
+# Argument field qualifiers and their interpretations.
+_sx_qualifiers = {
+	':': _sx_inline,
+	'|': _sx_literal,
+	'-': _sx_executable,
+	'\\': _sx_newlines,
+}
+
+def parse_sx_plan(text, qualifiers=_sx_qualifiers) -> typing.Tuple[
 		typing.Sequence[typing.Tuple[str, str]],
 		str,
 		typing.Sequence[str]
@@ -530,23 +562,11 @@ def parse_sx_plan(text) -> typing.Tuple[
 	parameters = []
 
 	for f in body:
-		if f[:1] == ':':
-			parameters.extend(f[1:].strip().split(' '))
-		elif f[:1] == '|':
-			parameters.append(f[1:])
-		elif f[:1] == '-':
-			parameters.append(exe)
-		elif f[:1] == '\\':
-			try:
-				nlines, suffix = f.split(' ', 1)
-				nlines = nlines[1:].strip()
-			except ValueError:
-				nlines = f[1:]
-				suffix = ''
-			parameters[-1] += (nlines.count('n') * '\n')
-			parameters[-1] += suffix
-		else:
+		try:
+			interpret = qualifiers[f[:1]]
+		except KeyError:
 			raise ValueError("unknown argument field qualifier")
+		interpret(parameters, exe, f)
 
 	return ([tuple(x.split('=', 1)+[None])[:2] for x in env], exe, parameters)
 
@@ -558,38 +578,39 @@ def serialize_sx_plan(triple, limit=8, inline=24) -> str:
 	from ..context.string import varsplit
 	env, exe, argv = triple
 
-	out = ""
+	parts = []
+	add = parts.append
+
 	for env, val in env:
 		if val is None:
-			yield env
+			add(env)
 		else:
-			out += env + '=' + val
-			yield env + '=' + val
+			add(env + '=' + val)
 
-		yield '\n'
+		add('\n')
 
-	yield exe
-	yield '\n'
+	add(exe)
+	add('\n')
 
 	if argv and argv[0] == exe:
-		yield '\t-\n'
+		add('\t-\n')
 		ai = iter(argv)
 		next(ai)
 	else:
 		ai = iter(argv)
 		if argv and '\n' not in argv[0]:
 			f = next(ai)
-			yield '\t|'
-			yield f
-			yield '\n'
+			add('\t|')
+			add(f)
+			add('\n')
 
 	iargs = []
 	for f in ai:
 		if len(iargs) >= limit:
 			# Emit due to limit.
-			yield '\t:'
-			yield ' '.join(iargs)
-			yield '\n'
+			add('\t:')
+			add(' '.join(iargs))
+			add('\n')
 			del iargs[:]
 
 		if len(f) < inline and not set(f).intersection({' ', '\n'}):
@@ -599,38 +620,40 @@ def serialize_sx_plan(triple, limit=8, inline=24) -> str:
 		elif iargs:
 			# Emit due to current field not being inlined.
 			if len(iargs) > 1:
-				yield '\t:'
-				yield ' '.join(iargs)
+				add('\t:')
+				add(' '.join(iargs))
 			else:
-				yield '\t|'
-				yield iargs[0]
-			yield '\n'
+				add('\t|')
+				add(iargs[0])
+			add('\n')
 			del iargs[:]
 
 		if '\n' in f:
 			fs = list(varsplit('\n', f))
-			yield '\t|'
-			yield fs[0]
-			yield '\n'
+			add('\t|')
+			add(fs[0])
+			add('\n')
 
 			for count, suffix in zip(fs[1::2], fs[2::2]):
-				yield '\t\\' + (count * 'n')
+				add('\t\\' + (count * 'n'))
 				if suffix:
-					yield ' '+suffix
-				yield '\n'
+					add(' '+suffix)
+				add('\n')
 		else:
-			yield '\t|'
-			yield f
-			yield '\n'
+			add('\t|')
+			add(f)
+			add('\n')
 	else:
 		if iargs:
 			if len(iargs) > 1:
-				yield '\t:'
-				yield ' '.join(iargs)
+				add('\t:')
+				add(' '.join(iargs))
 			else:
-				yield '\t|'
-				yield iargs[0]
-			yield '\n'
+				add('\t|')
+				add(iargs[0])
+			add('\n')
+
+	return ''.join(parts)
 
 class Platform(object):
 	"""
@@ -48,6 +48,18 @@ Endpoint endpoint_copy(PyObj);
 	} while(0);
 #define UNLIMITED_RETRY() errno = 0; goto RETRY_SYSCALL;
 
+/*
+	// Request non-blocking sockets at creation when the platform allows it,
+	// avoiding the separate fcntl(2) call.
+*/
+#ifdef SOCK_NONBLOCK
+	#define SOCKET_NONBLOCKING(DOMAIN, TYPE, PROTO) socket(DOMAIN, (TYPE)|SOCK_NONBLOCK, PROTO)
+	#define SET_NONBLOCKING(KP) 0
+#else
+	#define SOCKET_NONBLOCKING(DOMAIN, TYPE, PROTO) socket(DOMAIN, TYPE, PROTO)
+	#define SET_NONBLOCKING(KP) fcntl(KP, F_SETFL, O_NONBLOCK)
+#endif
+
 /**
 	// The failure structure prefers to have a name with the code.
 */
@@ -294,12 +306,12 @@ bind_sequence(Endpoint ep)
 {
 	kcall_t kc;
 	kport_t kp;
-	kp = socket(Endpoint_GetFamily(ep), ep->type, ep->transport);
+	kp = SOCKET_NONBLOCKING(Endpoint_GetFamily(ep), ep->type, ep->transport);
 
 	if (kp == -1)
 		return(-kc_socket);
 
-	if (fcntl(kp, F_SETFL, O_NONBLOCK) == -1)
+	if (SET_NONBLOCKING(kp) == -1)
 	{
 		kc = kc_fcntl;
 		goto error;
@@ -351,12 +363,12 @@ service_sequence(Endpoint ep, int backlog)
 {
 	kcall_t kc;
 	kport_t kp;
-	kp = socket(Endpoint_GetFamily(ep), SOCK_STREAM, ep->transport);
+	kp = SOCKET_NONBLOCKING(Endpoint_GetFamily(ep), SOCK_STREAM, ep->transport);
 
 	if (kp == -1)
 		return(-kc_socket);
 
-	if (fcntl(kp, F_SETFL, O_NONBLOCK) == -1)
+	if (SET_NONBLOCKING(kp) == -1)
 	{
 		kc = kc_fcntl;
 		goto error;
@@ -445,12 +457,12 @@ connect_sequence(Endpoint ep)
 	kcall_t kc = 0;
 	kport_t kp;
 
-	kp = socket(Endpoint_GetFamily(ep), ep->type, ep->transport);
+	kp = SOCKET_NONBLOCKING(Endpoint_GetFamily(ep), ep->type, ep->transport);
 
 	if (kp == -1)
 		return(-kc_socket);
 
-	if (fcntl(kp, F_SETFL, O_NONBLOCK) == -1)
+	if (SET_NONBLOCKING(kp) == -1)
 	{
 		kc = kc_fcntl;
 		goto error;
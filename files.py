@@ -19,10 +19,8 @@ import stat
 import typing
 import itertools
 import functools
-
-# Moving to cached class properties.
-import shutil
-import tempfile
+import threading
+import time
 
 from ..context.tools import cachedcalls
 from ..route.types import Selector, Segment
@@ -95,6 +93,14 @@ class RequirementViolation(Exception):
 
 		return f"{desc}\n{path}"
 
+# Encoding used by &Path.bytespath; constant for the lifetime of the process.
+_fs_encoding = sys.getfilesystemencoding()
+
+# File type bits of (python/attribute)`st_mode`; &stat.S_IFMT without the call.
+_fs_ifmt_mask = 0o170000
+# Execute permission bits for any of user, group, or other.
+_fs_x_mask = stat.S_IXUSR|stat.S_IXGRP|stat.S_IXOTH
+
 class Status(tuple):
 	"""
 	# File status interface providing symbolic names for the data packed in
@@ -248,22 +254,32 @@ class Status(tuple):
 		return (self.system.st_mode & stat.S_ISVTX)
 
 	@property
-	def executable(self, mask=stat.S_IXUSR|stat.S_IXGRP|stat.S_IXOTH) -> bool:
+	def executable(self, mask=_fs_x_mask, ifmt=_fs_ifmt_mask, ifreg=stat.S_IFREG) -> bool:
 		"""
 		# Whether the data file is considered executable by anyone.
 
 		# Extended attributes are not checked.
 		"""
-		return (self.system.st_mode & mask) != 0 and self.type == 'data'
+		mode = self.system.st_mode
+		return (mode & mask) != 0 and (mode & ifmt) == ifreg
 
 	@property
-	def searchable(self, mask=stat.S_IXUSR|stat.S_IXGRP|stat.S_IXOTH) -> bool:
+	def searchable(self, mask=_fs_x_mask, ifmt=_fs_ifmt_mask, ifdir=stat.S_IFDIR) -> bool:
 		"""
 		# Whether the directory file is considered searchable by anyone.
 
 		# Extended attributes are not checked.
 		"""
-		return (self.system.st_mode & mask) != 0 and self.type == 'directory'
+		mode = self.system.st_mode
+		return (mode & mask) != 0 and (mode & ifmt) == ifdir
+
+_fs_type_get = Status._fs_type_map.get
+
+# Type name to the set of masked (python/attribute)`st_mode` values it is assigned to.
+_fs_type_modes = {
+	t: frozenset(k for k, v in Status._fs_type_map.items() if v == t)
+	for t in set(Status._fs_type_map.values())
+}
 
 @cachedcalls(32)
 def path_string_cache(path):
@@ -274,13 +290,64 @@ def path_string_cache(path):
 	else:
 		return '/'.join(path.points)
 
+class _StatCache(threading.local):
+	# Thread local state of &Path.fs_stat_cache.
+	records = None
+	duration = 0.0
+
+_stat_cache = _StatCache()
+
+def path_status(path:str, follow_symlinks=True, stat=os.stat, monotonic=time.monotonic):
+	"""
+	# Retrieve the status record of the file at &path using &os.stat.
+
+	# When a &Path.fs_stat_cache context is active in the calling thread,
+	# records retrieved within the configured duration are reused.
+	"""
+
+	records = _stat_cache.records
+	if records is None:
+		return stat(path, follow_symlinks=follow_symlinks)
+
+	key = (path, follow_symlinks)
+	now = monotonic()
+	try:
+		st, ts = records[key]
+		if now - ts < _stat_cache.duration:
+			return st
+	except KeyError:
+		pass
+
+	st = stat(path, follow_symlinks=follow_symlinks)
+	records[key] = (st, now)
+	return st
+
+def _stat_cache_forget(path:str, contents=True):
+	# Discard cached status records of &path and, when &contents is true,
+	# any files contained by it.
+	records = _stat_cache.records
+	if not records:
+		return
+
+	if contents:
+		prefix = path.rstrip('/') + '/'
+		keys = [k for k in records if k[0] == path or k[0].startswith(prefix)]
+	else:
+		keys = [k for k in records if k[0] == path]
+
+	for key in keys:
+		del records[key]
+
+# Structured element produced by &Path.fs_snapshot when requested.
+Record = collections.namedtuple('Record', ('type', 'children', 'status', 'identifier', 'error'))
+
 class Path(Selector):
 	"""
 	# &Selector subclass for local filesystem paths.
 
 	# Methods starting with `fs_` perform filesystem operations.
 	"""
-	__slots__ = ('context', 'points',)
+	__slots__ = ('context', 'points', '_fullpath', '_bytespath',)
 
 	_path_separator = os.path.sep
 	_fs_access = functools.partial(
@@ -295,6 +362,12 @@ class Path(Selector):
 		'!': 0,
 	}
 
+	@property
+	def _fs_shutil(self):
+		import shutil
+		self.__class__._fs_shutil = shutil
+		return shutil
+
 	def fs_require(self, properties='', /, type=None):
 		"""
 		# Check the file for the expressed requirements using the effective user.
@@ -407,8 +480,8 @@ class Path(Selector):
 		return Class(None, tuple(points))
 
 	@classmethod
-	def from_absolute(Class, path:str, tuple=tuple):
-		return Class(None, tuple(x for x in path.split(Class._path_separator) if x))
+	def from_absolute(Class, path:str, tuple=tuple, filter=filter):
+		return Class(None, tuple(filter(None, path.split(Class._path_separator))))
 
 	@classmethod
 	def from_absolute_parts(Class, start:str, *paths:str):
@@ -426,7 +499,7 @@ class Path(Selector):
 
 	@staticmethod
 	def _partition_string(path:str) -> typing.Iterable[typing.Sequence[str]]:
-		return (x.strip('/').split('/') for x in path.split("//"))
+		return [x.strip('/').split('/') for x in path.split("//")]
 
 	@classmethod
 	def from_partitioned_string(Class, path:str):
@@ -445,7 +518,39 @@ class Path(Selector):
 
 	@classmethod
 	@contextlib.contextmanager
-	def fs_tmpdir(Class, TemporaryDirectory=tempfile.mkdtemp):
+	def fs_stat_cache(Class, duration:float=0.05):
+		"""
+		# Reuse status records retrieved by &fs_type, &fs_status, &fs_size,
+		# and &exists within the context.
+
+		# The cache is local to the calling thread and discarded when the
+		# outermost context exits; nested contexts share the records of the
+		# enclosing context and only override &duration.
+		# Modifications performed through &Path methods in the calling thread
+		# invalidate the records of the modified file, its contents, and its container.
+		# Files opened for writing with &fs_open are invalidated when opened;
+		# records retrieved while the file is open are kept after it is closed.
+		# Changes made by other means, including &Path methods used by other
+		# threads, are only observed after &duration seconds have elapsed.
+
+		# [ Parameters ]
+		# /duration/
+			# The number of seconds a status record may be reused.
+		"""
+
+		sc = _stat_cache
+		outer = (sc.records, sc.duration)
+		if sc.records is None:
+			sc.records = {}
+		sc.duration = duration
+		try:
+			yield Class
+		finally:
+			sc.records, sc.duration = outer
+
+	@classmethod
+	@contextlib.contextmanager
+	def fs_tmpdir(Class, TemporaryDirectory=None):
 		"""
 		# Create a temporary directory at a new route using a context manager.
 
@@ -457,6 +562,9 @@ class Path(Selector):
 		# behavior on some platforms.
 		"""
 
+		if TemporaryDirectory is None:
+			from tempfile import mkdtemp as TemporaryDirectory
+
 		d = TemporaryDirectory()
 		try:
 			r = Class.from_absolute(d).delimit()
@@ -485,24 +593,63 @@ class Path(Selector):
 	def fullpath(self) -> str:
 		"""
 		# Returns the full filesystem path designated by the route.
+
+		# The string is constructed once and retained by the instance.
 		"""
 
+		try:
+			return self._fullpath
+		except AttributeError:
+			pass
+
 		l = ['']
 		if self.context is not None:
 			l.append(path_string_cache(self.context))
 		l.extend(self.points)
 
-		return '/'.join(l) or '/'
+		fp = self._fullpath = '/'.join(l) or '/'
+		return fp
+
+	def _child(self, name:str, prefix:typing.Optional[str]=None):
+		"""
+		# Construct `self/name` while seeding the &fullpath of the new instance.
+
+		# &prefix, when given, must be the string that would be produced by
+		# `self._child_prefix()`; scanning loops compute it once per directory.
+		"""
+		if prefix is None:
+			prefix = self._child_prefix()
+
+		p = self.__class__(self.context, self.points + (name,))
+		p._fullpath = prefix + '/' + name
+		return p
+
+	def _child_prefix(self) -> str:
+		"""
+		# The string that &_child joins with the names of contained files.
+		"""
+		if self.context is None and not self.points:
+			# Root; avoid the leading double slash.
+			return ''
+		return self.fullpath
 
 	@property
-	def bytespath(self, encoding=sys.getfilesystemencoding()) -> bytes:
+	def bytespath(self) -> bytes:
 		"""
 		# Returns the full filesystem path designated by the route as a &bytes object
 		# returned by encoding the &fullpath in &sys.getfilesystemencoding with
 		# `'surrogateescape'` as the error mode.
+
+		# Like &fullpath, the encoded form is retained by the instance.
 		"""
 
-		return self.fullpath.encode(encoding, "surrogateescape")
+		try:
+			return self._bytespath
+		except AttributeError:
+			pass
+
+		bp = self._bytespath = self.fullpath.encode(_fs_encoding, "surrogateescape")
+		return bp
 
 	def join(self, *parts:str) -> str:
 		"""
@@ -512,12 +659,18 @@ class Path(Selector):
 		# Segment instances should be given with an asterisk applied to the argument.
 		"""
 
+		if self.points:
+			# Extend the (cached) &fullpath rather than rebuilding the context.
+			if not parts:
+				return self.fullpath
+			return '/'.join((self.fullpath, '/'.join(parts)))
+
 		if self.context is not None:
 			ctxstr = self.context.fullpath
 		else:
 			ctxstr = ''
 
-		subpath = self.points + parts
+		subpath = parts
 		if not subpath:
 			return ctxstr or '/'
 
@@ -580,13 +733,13 @@ class Path(Selector):
 
 		return self.__class__(ctx, tuple(rpoints))
 
-	def fs_status(self, stat=os.stat) -> Status:
+	def fs_status(self, stat=path_status) -> Status:
 		"""
 		# Construct a &Status instance using a system status record.
 		"""
 		return Status((stat(self.fullpath), self.identifier))
 
-	def fs_type(self, ifmt=stat.S_IFMT, stat=os.stat, type_map=Status._fs_type_map) -> str:
+	def fs_type(self, mask=_fs_ifmt_mask, stat=path_status, ftype=_fs_type_get, st=None) -> str:
 		"""
 		# The type of file the route points to. Transforms the result of an &os.stat
 		# call into a string describing the (python/attribute)`st_mode` field.
@@ -600,23 +753,27 @@ class Path(Selector):
 		# - `'void'`
 
 		# If no file is present at the path or a broken link is present, `'void'` will be returned.
+
+		# When &st, a status record already retrieved for the path, is given,
+		# no status request is performed.
 		"""
 
-		try:
-			s = stat(self.fullpath)
-		except FileNotFoundError:
-			return 'void'
+		if st is None:
+			try:
+				st = stat(self.fullpath)
+			except FileNotFoundError:
+				return 'void'
 
-		return type_map.get(ifmt(s.st_mode), 'unknown')
+		return ftype(st.st_mode & mask, 'unknown')
 
-	def fs_test(self, type:str=None) -> bool:
+	def fs_test(self, type:str=None, st=None) -> bool:
 		"""
-		# Perform a set of tests against a fresh status record.
+		# Perform a set of tests against a fresh status record, or &st when given.
 
 		# Returns &True when all the tests pass.
 		# &False if one fails or the file does not exist.
 		"""
-		t = self.fs_type()
+		t = self.fs_type(st=st)
 		if type is None:
 			if t == 'void':
 				return False
@@ -628,13 +785,15 @@ class Path(Selector):
 
 		return True
 
-	def fs_executable(self, get_stat=os.stat, mask=stat.S_IXUSR|stat.S_IXGRP|stat.S_IXOTH) -> bool:
+	def fs_executable(self, get_stat=os.stat, mask=stat.S_IXUSR|stat.S_IXGRP|stat.S_IXOTH, st=None) -> bool:
 		"""
 		# Whether the file at the route is considered to be an executable.
+		# When &st is given, its mode is checked instead of a fresh status record's.
 		"""
 
-		mode = get_stat(self.fullpath).st_mode
-		return (mode & mask) != 0
+		if st is None:
+			st = get_stat(self.fullpath)
+		return (st.st_mode & mask) != 0
 
 	def fs_follow_links(self, readlink=os.readlink, islink=os.path.islink) -> typing.Iterator[Selector]:
 		"""
@@ -658,7 +817,21 @@ class Path(Selector):
 
 		yield r
 
-	def fs_iterfiles(self, type=None, scandir=os.scandir):
+	@staticmethod
+	def _fs_entry_type(de, mask=_fs_ifmt_mask, ftype=_fs_type_get) -> str:
+		"""
+		# Identify the type of the file referenced by the &os.DirEntry, &de.
+		# Equivalent to &fs_type, but uses the status record cached by the entry.
+		"""
+
+		try:
+			st = de.stat()
+		except FileNotFoundError:
+			return 'void'
+
+		return ftype(st.st_mode & mask, 'unknown')
+
+	def fs_iterfiles(self, type=None, scandir=os.scandir, mask=_fs_ifmt_mask):
 		"""
 		# Generate &Path instances identifying the files held by the directory, &self.
 		# By default, all file types are included, but if the &type parameter is given,
@@ -673,22 +846,43 @@ class Path(Selector):
 			# User must make explicit checks to interrogate permission/existence.
 			return
 
+		prefix = self._child_prefix()
+		child = self._child
+
 		with dl as scan:
 			if type is None:
 				# No type constraint.
 				for de in scan:
-					yield self/de.name
+					yield child(de.name, prefix)
 			elif type == 'directory':
 				# Avoids the stat call in the last branch.
 				for de in scan:
 					if de.is_dir():
-						yield self/de.name
+						yield child(de.name, prefix)
+			elif type == 'data':
+				# Regular files are identified by the entry's cached type.
+				for de in scan:
+					if de.is_file():
+						yield child(de.name, prefix)
+			elif type in _fs_type_modes:
+				# Status record needed to filter here; use the entry's
+				# and compare the masked mode against the type's.
+				modes = _fs_type_modes[type]
+				for de in scan:
+					try:
+						m = de.stat().st_mode & mask
+					except FileNotFoundError:
+						# 'void'
+						continue
+
+					if m in modes:
+						yield child(de.name, prefix)
 			else:
-				# stat call needed (fs_type) to filter here.
+				# 'void' or 'unknown'.
+				etype = self._fs_entry_type
 				for de in scan:
-					r = self/de.name
-					if type == r.fs_type():
-						yield r
+					if type == etype(de):
+						yield child(de.name, prefix)
 
 	def fs_list(self, type='data', scandir=os.scandir):
 		"""
@@ -707,16 +901,19 @@ class Path(Selector):
 
 		dirs = []
 		files = []
+		prefix = self._child_prefix()
+		child = self._child
 
 		with dl as scan:
 			for de in scan:
-				sub = self/de.name
+				sub = child(de.name, prefix)
 				if de.is_dir():
 					dirs.append(sub)
-				else:
-					typ = sub.fs_type()
-					if sub.fs_type() == type:
+				elif type == 'data':
+					if de.is_file():
 						files.append(sub)
+				elif self._fs_entry_type(de) == type:
+					files.append(sub)
 
 		return (dirs, files)
 
@@ -747,8 +944,10 @@ class Path(Selector):
 			process=(lambda x, y: y[0] == 'exception'),
 			depth:typing.Optional[int]=8,
 			limit:typing.Optional[int]=2048,
-			ifmt=stat.S_IFMT, Queue=collections.deque, scandir=os.scandir,
-			lstat=os.lstat,
+			mask=_fs_ifmt_mask, Queue=collections.deque, scandir=os.scandir,
+			structured:bool=False,
+			dirfd=(os.scandir in os.supports_fd), dopen=os.open, close=os.close,
+			dflags=os.O_RDONLY|getattr(os, 'O_DIRECTORY', 0),
 		):
 		"""
 		# Construct an element tree of files from the directory referenced by &self.
@@ -769,13 +968,16 @@ class Path(Selector):
 			# The maximum number of elements to accumulate.
 			# If &None, no limit constraint is enforced.
 			# Defaults to `2048`.
+		# /structured/
+			# Produce &Record instances instead of `(type, children, attributes)`
+			# elements; avoids allocating an attributes dictionary per file.
 		"""
 
 		if depth == 0 or limit == 0:
 			# Allows presumption >= 1 or None.
 			return []
 
-		ftype = Status._fs_type_map.get
+		ftype = _fs_type_get
 
 		cdepth = 0
 		ncount = 0
@@ -784,8 +986,9 @@ class Path(Selector):
 		elements = []
 		cseq = Queue()
 		getnext = cseq.popleft
+		enqueue = cseq.append
 
-		cseq.append((self.delimit(), elements, self.fullpath))
+		enqueue((self.delimit(), elements, self.fullpath))
 
 		count = len(cseq)
 		while cseq:
@@ -793,46 +996,73 @@ class Path(Selector):
 			count -= 1
 
 			add = dirlist.append
+			fd = None
 			try:
-				scan = scandir(fp)
-			except OSError:
-				add(('exception', [], {'status': None, 'error': err}))
+				if dirfd:
+					# Scanning the descriptor has &de.stat use fstatat(2)
+					# relative to the directory instead of resolving the full path.
+					fd = dopen(fp, dflags)
+					scan = scandir(fd)
+				else:
+					scan = scandir(fp)
+			except OSError as err:
+				if fd is not None:
+					close(fd)
+
+				if structured:
+					add(Record('exception', [], None, None, err))
+				else:
+					add(('exception', [], {'status': None, 'error': err}))
 				continue
 
-			with scan as scan:
-				for de in scan:
-					file = subdir/de.name
+			prefix = subdir._child_prefix()
+			child = subdir._child
+			try:
+				with scan as scan:
+					for de in scan:
+						file = child(de.name, prefix)
 
-					try:
-						st = de.stat()
-						typ = ftype(ifmt(st.st_mode), 'unknown')
-						attrs = {'status': st, 'identifier': de.name}
-					except FileNotFoundError:
+						st = None
+						error = None
 						try:
-							st = lstat(subdir.join(de.name))
+							st = de.stat()
+							typ = ftype(st.st_mode & mask, 'unknown')
 						except FileNotFoundError:
-							# Probably concurrent delete in this case.
+							try:
+								st = de.stat(follow_symlinks=False)
+							except FileNotFoundError:
+								# Probably concurrent delete in this case.
+								continue
+
+							typ = 'void'
+						except Exception as err:
+							typ = 'exception'
+							error = err
+
+						if structured:
+							record = Record(typ, [], st, de.name, error)
+						else:
+							attrs = {'status': st, 'identifier': de.name}
+							if error is not None:
+								attrs['error'] = error
+							record = (typ, [], attrs)
+
+						if process(file, record):
 							continue
+						add(record)
 
-						typ = 'void'
-						attrs = {'status': st, 'identifier': de.name}
-					except Exception as err:
-						typ = 'exception'
-						attrs = {'status': st, 'identifier': de.name, 'error': err}
-
-					record = (typ, [], attrs)
-
-					if process(file, record):
-						continue
-					add(record)
-
-					nelements += 1
-					if limit is not None and nelements >= limit:
-						return elements
+						nelements += 1
+						if limit is not None and nelements >= limit:
+							return elements
 
-					if de.is_dir():
-						cseq.append((file, record[1], file.fullpath))
-						ncount += 1 # avoid len() call on deque
+						# &de.stat follows links like &de.is_dir, so the
+						# already identified type is sufficient.
+						if typ == 'directory':
+							enqueue((file, record[1], file.fullpath))
+							ncount += 1 # avoid len() call on deque
+			finally:
+				if fd is not None:
+					close(fd)
 
 			if count <= 0 and ncount:
 				cdepth += 1
@@ -844,7 +1074,7 @@ class Path(Selector):
 		return elements
 
 	def fs_since(self, since:int,
-			traversed=None,
+			traversed=None, stat=path_status,
 		) -> typing.Iterable[typing.Tuple[int, Selector]]:
 		"""
 		# Identify the set of files that have been modified
@@ -857,61 +1087,98 @@ class Path(Selector):
 		# /since/
 			# The point in time after which files and directories will be identified
 			# as being modified and returned inside the result set.
+		# /traversed/
+			# Optional set of `(st_dev, st_ino)` pairs identifying directories
+			# that have already been visited and should not be entered again.
+			# Real path strings are no longer recognized.
 		"""
 
-		# Traversed holds real absolute paths.
-		if not traversed:
+		if traversed is None:
 			traversed = set()
-			traversed.add(os.path.realpath(str(self)))
-		else:
-			rpath = os.path.realpath(str(self))
-			if rpath in traversed:
-				return
-			else:
-				traversed.add(rpath)
 
-		dirs, files = self.fs_list()
+		# Unix seconds less a second of slack to absorb any rounding performed
+		# by the time type; status records older than this can not follow &since
+		# and are skipped without constructing a time instance.
+		threshold = (since.select('unix') / 1000) - 1
+
+		# Depth first, directory files before subdirectories; reversed
+		# pushes maintain the listing order of the subdirectories.
+		stack = [self]
+		while stack:
+			d = stack.pop()
+
+			# Traversed holds device and inode pairs of the real directories.
+			try:
+				st = stat(d.fullpath)
+			except OSError:
+				# Missing or removed after its container was listed;
+				# consistent with &fs_list, which produces no files.
+				continue
+			rid = (st.st_dev, st.st_ino)
+			if rid in traversed:
+				continue
+			traversed.add(rid)
+
+			dirs, files = d.fs_list()
+
+			for x in files:
+				try:
+					st = stat(x.fullpath)
+				except FileNotFoundError:
+					continue
+				if st.st_mtime < threshold:
+					continue
 
-		for x in files:
-			mt = x.fs_status().last_modified
-			if mt.follows(since):
-				yield (mt, x)
+				mt = Status((st, x.identifier)).last_modified
+				if mt.follows(since):
+					yield (mt, x)
 
-		for x in dirs:
-			yield from x.fs_since(since, traversed=traversed)
+			stack.extend(reversed(dirs))
 
-	def fs_real(self, exists=os.path.exists):
+	def fs_real(self, stat=path_status):
 		"""
 		# Return the part of the Path that actually exists on the filesystem.
 		"""
 
+		# &self is the first path produced, so an existing file costs one status query.
 		for x in ~self:
-			if exists(x.fullpath):
-				return x
+			try:
+				stat(x.fullpath)
+			except (OSError, ValueError):
+				continue
+			return x
 
 		return root
 
-	def exists(self, exists=os.path.exists) -> bool:
+	def exists(self, stat=path_status) -> bool:
 		"""
 		# Query the filesystem and return whether or not the file exists.
 
 		# A Route to a symbolic link *will* return &False if the target does not exist.
 		"""
 
-		return exists(self.fullpath)
+		try:
+			stat(self.fullpath)
+		except (OSError, ValueError):
+			return False
+
+		return True
 
 	def fs_modified(self, utime=os.utime):
 		"""
 		# Update the modification time of the file identified by &self.
 		"""
+		_stat_cache_forget(self.fullpath)
 		return utime(self.fullpath)
 
-	def fs_size(self, stat=os.stat) -> int:
+	def fs_size(self, stat=path_status, st=None) -> int:
 		"""
-		# Return the size of the file as depicted by &os.stat.
+		# Return the size of the file as depicted by &os.stat, or by &st when given.
 		"""
 
-		return stat(self.fullpath, follow_symlinks=True).st_size
+		if st is None:
+			st = stat(self.fullpath, follow_symlinks=True)
+		return st.st_size
 
 	def get_last_modified(self) -> int:
 		"""
@@ -925,6 +1192,7 @@ class Path(Selector):
 		# Set the modification time of the file identified by the &Route.
 		"""
 
+		_stat_cache_forget(self.fullpath)
 		return utime(self.__str__(), (-1, time.select('unix')/1000))
 
 	def get_text_content(self, encoding:str='utf-8') -> str:
@@ -952,7 +1220,7 @@ class Path(Selector):
 		st = self.fs_status()
 		return (st.created, st.last_modified, st.st_size)
 
-	def fs_void(self, rmtree=shutil.rmtree, remove=os.remove):
+	def fs_void(self, rmtree=None, remove=os.remove):
 		"""
 		# Remove the file that is referenced by this path.
 
@@ -960,6 +1228,8 @@ class Path(Selector):
 		# If the Route refers to a directory, the contents and the directory will be removed.
 		"""
 		fp = self.fullpath
+		_stat_cache_forget(fp)
+		_stat_cache_forget(self.container.fullpath, False)
 
 		try:
 			typ = self.fs_type(stat=os.lstat)
@@ -968,12 +1238,12 @@ class Path(Selector):
 			return
 
 		if typ == 'directory':
-			return rmtree(fp)
+			return (rmtree or self._fs_shutil.rmtree)(fp)
 		else:
 			# typ is 'void' for broken links.
 			return remove(fp)
 
-	def fs_replace(self, replacement, copytree=shutil.copytree, copyfile=shutil.copy) -> None:
+	def fs_replace(self, replacement, copytree=None, copyfile=None) -> None:
 		"""
 		# Drop the existing file or directory, &self, and replace it with the
 		# file or directory at the given route, &replacement.
@@ -988,10 +1258,17 @@ class Path(Selector):
 		dst = self.fullpath
 		self.fs_void() #* Removal for replacement.
 
-		if replacement.fs_type() == 'directory':
-			copytree(src, dst, symlinks=True, copy_function=copyfile)
-		else:
-			copyfile(src, dst)
+		copyfile = copyfile or self._fs_shutil.copy
+		try:
+			if replacement.fs_type() == 'directory':
+				copytree = copytree or self._fs_shutil.copytree
+				copytree(src, dst, symlinks=True, copy_function=copyfile)
+			else:
+				copyfile(src, dst)
+		finally:
+			# Records retrieved during the copy.
+			_stat_cache_forget(dst)
+			_stat_cache_forget(self.container.fullpath, False)
 
 	def fs_link_relative(self, path, link=os.symlink) -> None:
 		"""
@@ -1010,11 +1287,13 @@ class Path(Selector):
 		try:
 			link(target, self.fullpath)
 		except FileExistsError:
+			# A file that survives or replaces the removal
+			# fails the second attempt with FileExistsError.
 			self.fs_void()
-			if self.fs_type() != 'void':
-				raise
-
 			link(target, self.fullpath)
+		finally:
+			_stat_cache_forget(self.fullpath)
+			_stat_cache_forget(self.container.fullpath, False)
 
 	def fs_link_absolute(self, path, link=os.symlink) -> None:
 		"""
@@ -1031,11 +1310,45 @@ class Path(Selector):
 		try:
 			link(target, self.fullpath)
 		except FileExistsError:
+			# A file that survives or replaces the removal
+			# fails the second attempt with FileExistsError.
 			self.fs_void()
-			if self.fs_type() != 'void':
-				raise
-
 			link(target, self.fullpath)
+		finally:
+			_stat_cache_forget(self.fullpath)
+			_stat_cache_forget(self.container.fullpath, False)
+
+	def _fs_absent(self, stat=os.stat) -> typing.List[Selector]:
+		"""
+		# Identify &self and its leading directories that do not exist.
+
+		# Ascends until an existing file is found using a single status
+		# request per path. The nearest path is first in the returned list.
+		"""
+
+		routes = []
+		for p in ~self:
+			try:
+				stat(p.fullpath)
+			except FileNotFoundError:
+				routes.append(p)
+			else:
+				break
+
+		return routes
+
+	def _fs_mkdirs(self, mkdir=os.mkdir):
+		"""
+		# Create &self and its leading directories that do not exist.
+
+		# The cached status records of the created directories
+		# and their containers are discarded.
+		"""
+
+		for x in reversed(self._fs_absent()):
+			mkdir(x.fullpath)
+			_stat_cache_forget(x.fullpath)
+			_stat_cache_forget(x.container.fullpath, False)
 
 	def fs_init(self, data:typing.Optional[bytes]=None, mkdir=os.mkdir, exists=os.path.exists):
 		"""
@@ -1054,15 +1367,8 @@ class Path(Selector):
 				self.fs_store(data) #* Re-initialize data file.
 			return self
 
-		routes = []
-		for p in ~self.container:
-			if p.fs_type() != 'void':
-				break
-			routes.append(p)
-
 		# Create leading directories.
-		for x in reversed(routes):
-			mkdir(x.fullpath)
+		self.container._fs_mkdirs(mkdir)
 
 		with self.fs_open('xb') as f: #* Save ACL errors, concurrent op created file
 			f.write(data or b'')
@@ -1075,19 +1381,12 @@ class Path(Selector):
 		# Returns the instance, &self.
 		"""
 
-		routes = []
-		for p in ~(self ** 1):
-			if p.fs_type() != 'void':
-				break
-			routes.append(p)
-
 		# Create leading directories.
-		for x in reversed(routes):
-			mkdir(x.fullpath)
+		(self ** 1)._fs_mkdirs(mkdir)
 
 		return self
 
-	def fs_mkdir(self, mkdir=os.mkdir, exists=os.path.exists):
+	def fs_mkdir(self, mkdir=os.mkdir):
 		"""
 		# Create a directory at the route.
 
@@ -1095,41 +1394,30 @@ class Path(Selector):
 		# Leading directories will be created as needed.
 		"""
 
-		fp = self.fullpath
-		if exists(fp):
-			return self
+		# Create leading directories and the directory itself.
+		self._fs_mkdirs(mkdir)
 
-		routes = []
-		for p in ~self.container:
-			if p.fs_type() != 'void':
-				break
-			routes.append(p)
-
-		# Create leading directories.
-		for x in reversed(routes):
-			mkdir(x.fullpath)
-
-		mkdir(fp)
 		return self
 
-	@contextlib.contextmanager
-	def fs_open(self, *args, **kw):
+	def fs_open(self, mode='r', *args, **kw):
 		"""
 		# Open the file pointed to by the route.
 
 		# If the file doesn't exist, create it; if the directories
 		# leading up to the file don't exist, create the directories too.
+
+		# The file object is returned directly and is its own context manager.
+		# Cached status records are discarded when opening for writing,
+		# not when the file is closed.
 		"""
 
-		f = open(self.fullpath, *args, **kw)
-		try:
-			f.__enter__()
-			yield f
-		except BaseException as err:
-			if not f.__exit__(err.__class__, err, err.__traceback__):
-				raise
-		else:
-			f.__exit__(None, None, None)
+		if mode.strip('rbt'):
+			# Writing, appending, or creating; cached status records are invalidated.
+			_stat_cache_forget(self.fullpath)
+			if 'w' in mode or 'x' in mode or 'a' in mode:
+				# Possibly created or truncated.
+				_stat_cache_forget(self.container.fullpath, False)
+		return open(self.fullpath, mode, *args, **kw)
 
 	def fs_load(self, mode='rb') -> bytes:
 		"""
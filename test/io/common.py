@@ -105,6 +105,12 @@ def loop(deliver, array, cycle = cycle, snapshot = snapshot):
 	except io.TransitionViolation:
 		pass
 
+def drain(array, *channels, state='exhausted', require=all, getattr=getattr):
+	# Cycle the array until &require is satisfied by the &state of the &channels.
+	while not require([getattr(x, state) for x in channels]):
+		with array:
+			pass
+
 class ArrayActionManager(object):
 	"""
 	# Manages the Array cycle in a separate thread to avoid inline management
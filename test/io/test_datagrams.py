@@ -146,9 +146,7 @@ def test_Datagrams_transfer_one(test):
 		rdga = alloc(1)
 		r.acquire(rdga)
 		w.acquire(dga)
-		while not r.exhausted or not w.exhausted:
-			with J:
-				pass
+		common.drain(J, r, w)
 
 		test/rdga.endpoint(0) == ep
 		test/bytes(rdga.payload(0)).strip(b'\x00') == b'foobar'
@@ -237,18 +235,14 @@ def test_Datagrams_invalid(test):
 		ep = r.endpoint()
 
 		w.acquire(b'')
-		while not w.exhausted:
-			with J:
-				pass
+		common.drain(J, w)
 		test/w.exhausted == True
 
 		dga = alloc(1)
 		dga.set_endpoint(0, ep)
 		w.acquire(dga)
 		r.acquire(bytearray(0))
-		while not r.exhausted:
-			with J:
-				pass
+		common.drain(J, r)
 		test/r.exhausted == True
 	finally:
 		J.void()
@@ -1,23 +1,41 @@
 import sys
 import os
 import errno
+import itertools
+import contextlib
+from . import common
 from ... import io
 
 def nomem(x):
 	raise MemoryError(x)
 
-def _error(n, _en = errno.EINTR):
-	yield None
-	for x in range(n):
-		yield (_en,)
-	# signal real call
-	while True:
-		yield False
+def error(n, _en=errno.EINTR, chain=itertools.chain, repeat=itertools.repeat):
+	# Injection callback producing &n errors before
+	# signalling the real call with &False indefinitely.
+	i = chain(repeat((_en,), n), repeat(False))
+	return (lambda ctx: next(i))
+
+@contextlib.contextmanager
+def injections(**callbacks):
+	# Install errno injections for the duration of the block;
+	# the receptacle is cleared on exit.
+	receptacle = io.__ERRNO_RECEPTACLE__
+	receptacle.update(callbacks)
+	try:
+		yield receptacle
+	finally:
+		receptacle.clear()
 
-def error(*args, **kw):
-	g = _error(*args, **kw)
-	next(g)
-	return g.send
+@contextlib.contextmanager
+def scoped_array():
+	# Array that is terminated and fully drained on exit.
+	J = io.Array()
+	try:
+		yield J
+	finally:
+		J.terminate()
+		with J:
+			pass
 
 def errno_retry_callback(ctx):
 	return (errno.EINTR,)
@@ -39,27 +57,18 @@ def test_array_force_eintr(test):
 	test.skip(not '__ERRNO_RECEPTACLE__' in dir(io))
 	test.skip(sys.platform == 'linux')
 	# Should trigger the limit.
-	try:
-		J = io.Array()
-
-		g = io.__ERRNO_RECEPTACLE__['port_kevent'] = error(256, errno.EINTR)
+	with scoped_array() as J, injections(port_kevent=error(256, errno.EINTR)) as R:
+		g = R['port_kevent']
 		J.force()
 		test/J.port.error_code == errno.EINTR
 		test/J.port.call == 'kevent'
 		test/g(0) == (errno.EINTR,)
-	finally:
-		io.__ERRNO_RECEPTACLE__.clear()
-		J.terminate()
-		with J:
-			pass
 
 def test_array_retry_fail(test):
 	test.skip(not '__ERRNO_RECEPTACLE__' in dir(io))
 	test.skip(sys.platform == 'linux')
 	# Should trigger the limit.
-	try:
-		J = io.Array()
-
+	with scoped_array() as J, injections() as R:
 		# exercise change's unlimited retry
 
 		fr, fw = os.pipe()
@@ -68,19 +77,19 @@ def test_array_retry_fail(test):
 		J.acquire(r)
 		J.acquire(w)
 
-		g = io.__ERRNO_RECEPTACLE__['port_kevent'] = error(256, errno.EINTR)
+		g = R['port_kevent'] = error(256, errno.EINTR)
 		with J:
 			pass
 		test/J.port.error_code == 0
 		test/J.port.call == None
 		test/g(0) == False
 
-		del io.__ERRNO_RECEPTACLE__['port_kevent']
+		del R['port_kevent']
 
 		J.force()
 
 		# limited retry on kevent collection success
-		g = io.__ERRNO_RECEPTACLE__['port_kevent'] = error(8, errno.EINTR)
+		g = R['port_kevent'] = error(8, errno.EINTR)
 
 		with J:
 			pass
@@ -89,10 +98,10 @@ def test_array_retry_fail(test):
 		test/g(0) == False
 
 		# limited retry on kevent collection gave up
-		del io.__ERRNO_RECEPTACLE__['port_kevent']
+		del R['port_kevent']
 		J.force()
 
-		g = io.__ERRNO_RECEPTACLE__['port_kevent'] = error(512, errno.EINTR)
+		g = R['port_kevent'] = error(512, errno.EINTR)
 
 		with J:
 			pass
@@ -100,20 +109,11 @@ def test_array_retry_fail(test):
 		test/J.port.call == 'kevent'
 		test/g(0) == (errno.EINTR,)
 
-	finally:
-		io.__ERRNO_RECEPTACLE__.clear()
-		J.terminate()
-		with J:
-			pass
-
 def test_acquire_retry_fail(test):
 	test.skip(not '__ERRNO_RECEPTACLE__' in dir(io))
 	test.skip(sys.platform == 'linux')
 	# Should trigger the limit.
-	try:
-		J = io.Array()
-		io.__ERRNO_RECEPTACLE__['port_identify_type'] = errno_retry_callback
-
+	with scoped_array() as J, injections(port_identify_type=errno_retry_callback):
 		for typ in [io.alloc_input, io.alloc_output]:
 			s = typ(-14)
 			test/s.port.error_code == errno.EINTR
@@ -124,20 +124,18 @@ def test_acquire_retry_fail(test):
 			test/J.sizeof_transfer() == 2
 			for x in J.transfer():
 				test/x.terminated == True
-	finally:
-		io.__ERRNO_RECEPTACLE__.clear()
-		J.terminate()
-		with J:
-			pass
 
 def test_datagrams_io_retry(test):
 	test.skip(not '__ERRNO_RECEPTACLE__' in dir(io))
 	# Should *not* trigger the limit with EINTR
 	from ... import network
-	J = io.Array()
-	try:
-		g1 = io.__ERRNO_RECEPTACLE__['port_input_datagrams'] = error(8)
-		g2 = io.__ERRNO_RECEPTACLE__['port_output_datagrams'] = error(6)
+	inject = {
+		'port_input_datagrams': error(8),
+		'port_output_datagrams': error(6),
+	}
+	with scoped_array() as J, injections(**inject) as R:
+		g1 = R['port_input_datagrams']
+		g2 = R['port_output_datagrams']
 
 		ep = network.Endpoint.from_ip4(('127.0.0.1', 0), type='datagrams')
 		s = network.bind(ep)
@@ -151,16 +149,14 @@ def test_datagrams_io_retry(test):
 		dga.set_endpoint(0, r.endpoint())
 		w.acquire(dga)
 
-		while not r.exhausted or not w.exhausted:
-			with J:
-				pass
+		common.drain(J, r, w)
 
 		test/g1(0) == False
 		test/g2(0) == False
 
 		# doesn't give up
-		e1 = io.__ERRNO_RECEPTACLE__['port_input_datagrams'] = error(128)
-		e2 = io.__ERRNO_RECEPTACLE__['port_output_datagrams'] = error(128)
+		e1 = R['port_input_datagrams'] = error(128)
+		e2 = R['port_output_datagrams'] = error(128)
 
 		rdga = io.DatagramArray('ip4', 1024, 1)
 		r.acquire(rdga)
@@ -168,23 +164,19 @@ def test_datagrams_io_retry(test):
 		dga.set_endpoint(0, r.endpoint())
 		w.acquire(dga)
 
-		while not r.exhausted and not w.exhausted:
-			with J:
-				pass
-	finally:
-		io.__ERRNO_RECEPTACLE__.clear()
-		J.terminate()
-		with J:
-			pass
+		common.drain(J, r, w, require=any)
 
 def test_datagrams_io_nomem_retry(test):
 	from ... import network
 	test.skip(not '__ERRNO_RECEPTACLE__' in dir(io))
 	# Should *not* trigger the limit with EINTR
-	J = io.Array()
-	try:
-		g1 = io.__ERRNO_RECEPTACLE__['port_input_datagrams'] = error(8, errno.ENOMEM)
-		g2 = io.__ERRNO_RECEPTACLE__['port_output_datagrams'] = error(6, errno.ENOMEM)
+	inject = {
+		'port_input_datagrams': error(8, errno.ENOMEM),
+		'port_output_datagrams': error(6, errno.ENOMEM),
+	}
+	with scoped_array() as J, injections(**inject) as R:
+		g1 = R['port_input_datagrams']
+		g2 = R['port_output_datagrams']
 
 		ep = network.Endpoint.from_ip4(('127.0.0.1', 0), type='datagrams')
 		s = network.bind(ep)
@@ -198,16 +190,14 @@ def test_datagrams_io_nomem_retry(test):
 		dga.set_endpoint(0, r.endpoint())
 		w.acquire(dga)
 
-		while not r.exhausted or not w.exhausted:
-			with J:
-				pass
+		common.drain(J, r, w)
 
 		test/g1(0) == False
 		test/g2(0) == False
 
 		# gives up
-		e1 = io.__ERRNO_RECEPTACLE__['port_input_datagrams'] = error(256, errno.ENOMEM)
-		e2 = io.__ERRNO_RECEPTACLE__['port_output_datagrams'] = error(256, errno.ENOMEM)
+		e1 = R['port_input_datagrams'] = error(256, errno.ENOMEM)
+		e2 = R['port_output_datagrams'] = error(256, errno.ENOMEM)
 
 		rdga = io.DatagramArray('ip4', 1024, 1)
 		r.acquire(rdga)
@@ -215,14 +205,7 @@ def test_datagrams_io_nomem_retry(test):
 		dga.set_endpoint(0, r.endpoint())
 		w.acquire(dga)
 
-		while not r.terminated and not w.terminated:
-			with J:
-				pass
-	finally:
-		io.__ERRNO_RECEPTACLE__.clear()
-		J.terminate()
-		with J:
-			pass
+		common.drain(J, r, w, state='terminated', require=any)
 
 def test_datagrams_io_again(test):
 	"""
@@ -230,17 +213,16 @@ def test_datagrams_io_again(test):
 	"""
 	from ... import network
 	test.skip(not '__ERRNO_RECEPTACLE__' in dir(io))
-	J = io.Array()
-	try:
-		# send one and then trigger EAGAIN
-		def eagain(errno = errno.EAGAIN):
-			yield None
-			yield False
-			while True:
-				yield (errno,)
-		g = eagain()
-		next(g)
-		io.__ERRNO_RECEPTACLE__['port_output_datagrams'] = g.send
+	# send one and then trigger EAGAIN
+	def eagain(errno = errno.EAGAIN):
+		yield None
+		yield False
+		while True:
+			yield (errno,)
+	g = eagain()
+	next(g)
+
+	with scoped_array() as J, injections(port_output_datagrams=g.send):
 
 		ep = network.Endpoint.from_ip4(('127.0.0.1', 0), type='datagrams')
 		s = network.bind(ep)
@@ -256,20 +238,13 @@ def test_datagrams_io_again(test):
 		dga.payload(1)[:] = b'x' * len(dga.payload(1))
 		w.acquire(dga)
 
-		while not r.exhausted:
-			with J:
-				pass
+		common.drain(J, r)
 
 		# only writes one
 		test/w.exhausted == False
 		test/r.exhausted == True
 		test/rdga.endpoint(0) == r.endpoint()
 		test/rdga.payload(0)[:6] == b'foobar'
-	finally:
-		io.__ERRNO_RECEPTACLE__.clear()
-		J.terminate()
-		with J:
-			pass
 
 def test_octets_resize_error(test):
 	import socket
@@ -303,47 +278,25 @@ def test_octets_resize_error(test):
 		io.__ERRNO_RECEPTACLE__.clear()
 		J.void()
 
-def test_array_alloc_port_memory_errors(test):
-	test.skip(not '__ERRNO_RECEPTACLE__' in dir(io))
-	try:
-		io.__PYTHON_RECEPTACLE__['alloc_port'] = nomem
-
-		with test/MemoryError as exc:
-			io.alloc_input(8)
-
-		with test/MemoryError as exc:
-			io.alloc_output(8)
-
-		with test/MemoryError as exc:
-			io.alloc_octets(8)
-	finally:
-		io.__PYTHON_RECEPTACLE__.clear()
+# Python receptacle keys and the allocations expected to fail with them installed.
+alloc_memory_errors = [
+	(('alloc_port',), ('alloc_input', 'alloc_output', 'alloc_octets')),
+	(('alloci', 'alloco'), ('alloc_input', 'alloc_output')),
+	(('allocio.alloc_pair', 'alloci'), ('alloc_octets',) * 4),
+]
 
-def test_array_alloc_i_o_memory_errors(test):
+def test_array_alloc_memory_errors(test):
 	test.skip(not '__ERRNO_RECEPTACLE__' in dir(io))
+	receptacle = io.__PYTHON_RECEPTACLE__
 	try:
-		io.__PYTHON_RECEPTACLE__['alloci'] = nomem
-		io.__PYTHON_RECEPTACLE__['alloco'] = nomem
-
-		with test/MemoryError as exc:
-			io.alloc_input(8)
-
-		with test/MemoryError as exc:
-			io.alloc_output(8)
-	finally:
-		io.__PYTHON_RECEPTACLE__.clear()
-
-def test_array_allocio_memory_errors(test):
-	test.skip(not '__ERRNO_RECEPTACLE__' in dir(io))
-	try:
-		io.__PYTHON_RECEPTACLE__['allocio.alloc_pair'] = nomem
-		io.__PYTHON_RECEPTACLE__['alloci'] = nomem
-
-		for i in range(4):
-			with test/MemoryError as exc:
-				io.alloc_octets(8)
+		for keys, allocators in alloc_memory_errors:
+			receptacle.update(dict.fromkeys(keys, nomem))
+			for name in allocators:
+				with test/MemoryError as exc:
+					getattr(io, name)(8)
+			receptacle.clear()
 	finally:
-		io.__PYTHON_RECEPTACLE__.clear()
+		receptacle.clear()
 
 def test_nosigpipe(test):
 	test.skip(not '__ERRNO_RECEPTACLE__' in dir(io))
@@ -395,10 +348,8 @@ def test_octets_acquire_retry(test):
 	test.skip(not '__ERRNO_RECEPTACLE__' in dir(io))
 	test.skip(sys.platform == 'linux')
 	# Should trigger the limit.
-	try:
-		J = io.Array()
-
-		g1 = io.__ERRNO_RECEPTACLE__['port_identify_type'] = error(8)
+	with scoped_array() as J, injections(port_identify_type=error(8)) as R:
+		g1 = R['port_identify_type']
 
 		s = io.alloc_input(-14)
 		test/g1(0) == False
@@ -406,7 +357,7 @@ def test_octets_acquire_retry(test):
 		test/s.port.call == 'fstat'
 		J.acquire(s)
 
-		g1 = io.__ERRNO_RECEPTACLE__['port_identify_type'] = error(14)
+		g1 = R['port_identify_type'] = error(14)
 
 		s = io.alloc_output(-14)
 		test/g1(0) == False
@@ -418,20 +369,14 @@ def test_octets_acquire_retry(test):
 			test/J.sizeof_transfer() == 2
 			for x in J.transfer():
 				test/x.terminated == True
-	finally:
-		io.__ERRNO_RECEPTACLE__.clear()
-		J.terminate()
-		with J:
-			pass
 
 def test_octets_acquire_mustblock(test):
 	test.skip(not '__ERRNO_RECEPTACLE__' in dir(io))
 	test.skip(sys.platform == 'linux')
-	try:
-		J = io.Array()
+	with scoped_array() as J, injections() as R:
 		r, w = os.pipe()
 
-		g1 = io.__ERRNO_RECEPTACLE__['port_noblocking'] = error(256)
+		g1 = R['port_noblocking'] = error(256)
 
 		s = io.alloc_input(r)
 		test/g1(0) == (errno.EINTR,)
@@ -439,7 +384,7 @@ def test_octets_acquire_mustblock(test):
 		test/s.port.call == 'fcntl'
 		J.acquire(s)
 
-		g1 = io.__ERRNO_RECEPTACLE__['port_noblocking'] = error(256)
+		g1 = R['port_noblocking'] = error(256)
 
 		s = io.alloc_output(w)
 		test/g1(0) == (errno.EINTR,)
@@ -451,11 +396,6 @@ def test_octets_acquire_mustblock(test):
 			test/J.sizeof_transfer() == 2
 			for x in J.transfer():
 				test/x.terminated == True
-	finally:
-		io.__ERRNO_RECEPTACLE__.clear()
-		J.terminate()
-		with J:
-			pass
 
 def test_datagramarray_nomem(test):
 	test.skip(not '__ERRNO_RECEPTACLE__' in dir(io))
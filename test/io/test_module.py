@@ -20,6 +20,9 @@ def test_no_subtyping(test):
 	types = (
 		io.Array,
 		io.Octets,
+		io.Datagrams,
+		io.DatagramArray,
+		io.Port,
 	)
 
 	for x in types:
@@ -154,7 +154,7 @@ def test_serialize_sx_plan_escapes(test):
 		]
 	)
 
-	sxp = ''.join(module.serialize_sx_plan(sample))
+	sxp = module.serialize_sx_plan(sample)
 	test/sxp.split('\n') == [
 		"ENV=env-string",
 		"/bin/cat",
@@ -179,7 +179,7 @@ def test_serialize_sx_plan_none(test):
 		]
 	)
 
-	sxp = ''.join(module.serialize_sx_plan(sample))
+	sxp = module.serialize_sx_plan(sample)
 	test/sxp.split('\n') == [
 		"ENV=env-string",
 		"ZERO",
@@ -263,7 +263,7 @@ def pfi(path, pairs):
 
 	for a, exe in pairs:
 		sxp = module.serialize_sx_plan(([], exe, ['-F']))
-		(plans/a).fs_store(''.join(sxp).encode('utf-8'))
+		(plans/a).fs_store(sxp.encode('utf-8'))
 
 def test_Platform_from_directory(test):
 	"""
@@ -283,7 +283,7 @@ def test_Platform_from_directory(test):
 	sxp = module.serialize_sx_plan((
 		[], '/bin/dispatch-system', ['-F']
 	))
-	((path/'plans').fs_mkdir()/'machine-class').fs_store(''.join(sxp).encode('utf-8'))
+	((path/'plans').fs_mkdir()/'machine-class').fs_store(sxp.encode('utf-8'))
 
 	single = module.Platform.from_directory(path)
 	env, exe, args = single.prepare('machine-class', 'factor.path', ['argn'])
@@ -91,6 +91,78 @@ def test_Path_temporary(test):
 	# temporary context over, should not exist.
 	test/os.path.exists(path) == False
 
+def test_Path_stat_cache(test):
+	"""
+	# - &lib.Path.fs_stat_cache
+	"""
+	t = test.exits.enter_context(lib.Path.fs_tmpdir())
+	f = t/'file'
+	f.fs_init(b'data')
+
+	with lib.Path.fs_stat_cache(duration=3600):
+		test/f.fs_size() == 4
+		st = f.fs_status().system
+
+		# Modified outside of &lib.Path; cached record is retained.
+		with open(f.fullpath, 'ab') as fp:
+			fp.write(b'more')
+		test/f.fs_size() == 4
+		test/f.fs_status().system == st
+
+		# Modified through &lib.Path; entry is invalidated.
+		f.fs_store(b'stored')
+		test/f.fs_size() == 6
+
+		f.fs_void()
+		test/f.exists() == False
+		test/f.fs_type() == 'void'
+
+	# Outside of the context, records are not cached.
+	f.fs_init(b'data')
+	with open(f.fullpath, 'ab') as fp:
+		fp.write(b'more')
+	test/f.fs_size() == 8
+
+	# Nested contexts share records; inner modifications invalidate outer entries.
+	with lib.Path.fs_stat_cache(duration=3600):
+		test/f.exists() == True
+		with lib.Path.fs_stat_cache(duration=3600):
+			f.fs_void()
+		test/f.exists() == False
+
+		# Reads do not invalidate.
+		f.fs_store(b'data')
+		test/f.fs_size() == 4
+		with open(f.fullpath, 'ab') as fp:
+			fp.write(b'more')
+		test/f.fs_load() == b'datamore'
+		test/f.fs_size() == 4
+
+		# Records retrieved while the file is open for writing are retained.
+		with f.fs_open('wb') as fp:
+			fp.write(b'abc')
+			fp.flush()
+			test/f.fs_size() == 3
+			fp.write(b'defg')
+		test/f.fs_size() == 3
+
+	# Created directories and files invalidate their container's record.
+	with lib.Path.fs_stat_cache(duration=3600):
+		nlink = t.fs_status().system.st_nlink
+		(t/'d2').fs_mkdir()
+		test/t.fs_status().system.st_nlink == nlink + 1
+		test/t.fs_status().system == os.stat(t.fullpath)
+
+		d3 = t/'d3'
+		sub = d3/'sub'
+		test/d3.fs_type() == 'void'
+		(sub/'file').fs_init(b'')
+		test/d3.fs_status().system.st_nlink == 3
+		test/t.fs_status().system.st_nlink == nlink + 2
+
+		(sub/'other').fs_store(b'')
+		test/sub.fs_status().system == os.stat(sub.fullpath)
+
 def test_Path_list(test):
 	"""
 	# - &lib.Path.fs_list
@@ -159,6 +231,22 @@ def test_Path_iterfiles(test):
 	test/list(t.fs_iterfiles('socket')) == []
 	test/list(t.fs_iterfiles('device')) == []
 	test/list(t.fs_iterfiles('pipe')) == []
+	test/list(t.fs_iterfiles('void')) == []
+
+	# Filtered by the entry's status record.
+	fifo = t/'fifo'
+	os.mkfifo(fifo.fullpath)
+	broken = t/'broken'
+	broken.fs_link_relative(t/'no-such-target')
+
+	test/list(t.fs_iterfiles('pipe')) == [fifo]
+	test/list(t.fs_iterfiles('void')) == [broken]
+	test/list(t.fs_iterfiles('socket')) == []
+	test/list(t.fs_iterfiles('device')) == []
+
+	dl = list(t.fs_iterfiles('data'))
+	dl.sort(key=K)
+	test/dl == expect_files
 
 def test_Path_index(test):
 	"""
@@ -338,6 +426,28 @@ def test_Path_size(test):
 	test/f3.fs_size() == 3
 	test/f4.fs_size() == 4
 
+def test_Path_status_record(test):
+	"""
+	# - &lib.Path.fs_type
+	# - &lib.Path.fs_test
+	# - &lib.Path.fs_executable
+	# - &lib.Path.fs_size
+	"""
+
+	t = test.exits.enter_context(lib.Path.fs_tmpdir())
+	f = t / 'data-file.txt'
+	f.fs_init(b'nothing')
+	st = f.fs_status().system
+
+	# Given records are used without querying the, now absent, file.
+	f.fs_void()
+	test/f.fs_type() == 'void'
+	test/f.fs_type(st=st) == 'data'
+	test/f.fs_test('data', st=st) == True
+	test/f.fs_test('directory', st=st) == False
+	test/f.fs_executable(st=st) == False
+	test/f.fs_size(st=st) == 7
+
 def test_Path_get_last_modified(test):
 	"""
 	# System check.
@@ -627,6 +737,24 @@ def test_Path_absolute_links(test):
 	"""
 	link_checks(test, lib.Path.fs_link_absolute)
 
+def test_Path_since_absent(test):
+	"""
+	# &lib.Path.fs_since with missing and concurrently removed directories.
+	"""
+	ago = sysclock.now().rollback(minute=10)
+
+	t = test.exits.enter_context(lib.Path.fs_tmpdir())
+	test/list((t/'does-not-exist').fs_since(ago)) == []
+
+	f = (t/'file').fs_init()
+	(t/'subdir'/'file').fs_init()
+
+	# Files of the directory are produced before its subdirectories are entered.
+	i = t.fs_since(ago)
+	test/next(i)[1] == f
+	(t/'subdir').fs_void()
+	test/list(i) == []
+
 def test_Path_recursive_since(test):
 	"""
 	# &lib.Path.fs_since with recursive directories.
@@ -729,6 +857,32 @@ def test_Path_snapshot_sanity(test):
 	test/set(x[2]['identifier'] for x in sub) == {'name-1', 'name-2'}
 	test/sum(x[2]['status'].st_size for x in sub) == 512
 
+def test_Path_snapshot_structured(test):
+	"""
+	# - &lib.Path.fs_snapshot
+	# - &lib.Record
+	"""
+
+	td = test.exits.enter_context(lib.Path.fs_tmpdir())
+	d_setup({
+		'subdir': {
+			'name-1': b'-' * 256,
+		},
+		'file-1': b'data1',
+	}, td)
+
+	elements = td.fs_snapshot(structured=True)
+	elements.sort(key=(lambda x: x.identifier))
+	test/[x.identifier for x in elements] == ['file-1', 'subdir']
+	test/[x.type for x in elements] == ['data', 'directory']
+	test/elements[0].status == os.stat((td/'file-1').fullpath)
+	test/elements[0].error == None
+
+	sub = elements[1].children
+	test/len(sub) == 1
+	test/sub[0].identifier == 'name-1'
+	test/sub[0].status.st_size == 256
+
 def test_Path_snapshot_limit(test):
 	"""
 	# - &lib.Path.fs_snapshot
@@ -19,15 +19,13 @@ def perform_cat(pids, input, output, data, *errors):
 	input.flush()
 	input.close()
 
-	out = b''
+	out = bytearray()
 	while out != data:
 		out += output.read(len(data) - len(out))
 
 	for e in error:
 		e.close()
 
-	status = []
-
 	# Workaround for macos.
 	# Process (cat) exits don't appear to be occurring properly
 	# on macos. (Thu Jun 22 09:33:35 MST 2017)
@@ -37,9 +35,7 @@ def perform_cat(pids, input, output, data, *errors):
 	for pid in pids:
 		os.kill(pid, 9)
 
-	for pid in pids:
-		r = os.waitpid(pid, 0)
-		status.append(r)
+	status = [os.waitpid(pid, 0) for pid in pids]
 	output.close()
 
 	return data, status